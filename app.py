@@ -1,23 +1,38 @@
-# Fix for ChromaDB SQLite compatibility on Streamlit Cloud only
-try:
-    import streamlit.web.cli as stcli
-    # Only apply fix when running on Streamlit Cloud
-    import sys
-    __import__('pysqlite3')
-    sys.modules['sqlite3'] = sys.modules.pop('pysqlite3')
-except (ImportError, ModuleNotFoundError):
-    # Running locally or pysqlite3 not available, use regular sqlite3
-    pass
+import os
+import sys
+
+# Fix for ChromaDB SQLite compatibility on Streamlit Cloud only. The
+# env/path check is cheap and the swap only happens once per process -
+# no need to import anything heavy just to detect the platform.
+if "pysqlite3" not in sys.modules and (
+    os.environ.get("STREAMLIT_CLOUD") or os.path.exists("/mount/src")
+):
+    try:
+        __import__('pysqlite3')
+        sys.modules['sqlite3'] = sys.modules.pop('pysqlite3')
+    except (ImportError, ModuleNotFoundError):
+        # pysqlite3 not available, use regular sqlite3
+        pass
 
 import streamlit as st
-from openai import OpenAI
-from anthropic import Anthropic
-import os
+from openai import AsyncOpenAI
+
+# aiohttp transport avoids httpx connection-pool contention under concurrency
+try:
+    from openai import DefaultAioHttpClient
+except ImportError:
+    DefaultAioHttpClient = None
+
+from anthropic import AsyncAnthropic
+import asyncio
+import threading
+import uuid
 from dotenv import load_dotenv
 import chromadb
 from chromadb.utils import embedding_functions
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import speech_recognition as sr
+from llm_pool import LLMPool
 
 # Load environment variables
 load_dotenv()
@@ -54,145 +69,309 @@ else:
     @st.cache_resource
     def init_vector_databases():
         client = chromadb.PersistentClient(path="./content_memory")
-        ef = embedding_functions.DefaultEmbeddingFunction()
+
+        # Best-effort SQLite tuning for write throughput. WAL + NORMAL
+        # stays crash-safe; the rest just cut fsync and temp-file I/O.
+        # This reaches into Chroma internals, so swallow failures if the
+        # internal API drifts between versions.
+        try:
+            sysdb = getattr(client, "_sysdb", None) or client._server._sysdb
+            conn = sysdb._conn_pool.connect()
+            for pragma in (
+                "journal_mode=WAL",
+                "synchronous=NORMAL",
+                "temp_store=MEMORY",
+                "mmap_size=268435456",
+                "cache_size=-65536",
+            ):
+                conn.execute(f"PRAGMA {pragma}")
+        except Exception:
+            pass
+
+        # ONNX MiniLM embedder - same model as the default function, but
+        # constructed with an explicit CPU provider and able to embed a
+        # whole list per call. Saves precompute their vectors through
+        # embed_one and flushes pass embeddings= to .add(), so at runtime
+        # this function only embeds query texts (and backs embed_one).
+        try:
+            ef = embedding_functions.ONNXMiniLM_L6_V2(
+                preferred_providers=["CPUExecutionProvider"]
+            )
+        except Exception:
+            ef = embedding_functions.DefaultEmbeddingFunction()
         
+        # Write-friendly HNSW settings: per-user collections stay small
+        # and are queried rarely, so fewer graph edges per insert (low M)
+        # beats maximal recall; search_ef is raised to claw most of the
+        # recall back at query time
+        hnsw_settings = {
+            "hnsw:space": "cosine",
+            "hnsw:M": 8,
+            "hnsw:construction_ef": 64,
+            "hnsw:search_ef": 32,
+        }
+
         # My content style collection
         my_style_collection = client.get_or_create_collection(
             name="my_content_style",
-            embedding_function=ef
+            embedding_function=ef,
+            metadata=dict(hnsw_settings)
         )
-        
+
         # Favorite creators collection
         creators_collection = client.get_or_create_collection(
             name="favorite_creators",
-            embedding_function=ef
+            embedding_function=ef,
+            metadata=dict(hnsw_settings)
         )
         
-        return my_style_collection, creators_collection
+        return my_style_collection, creators_collection, ef
+
+    my_style_collection, creators_collection, embedder = init_vector_databases()
+
+    # Keyed on the text itself, so re-saving identical content reuses the
+    # cached vector instead of re-running the embedding model
+    @st.cache_data
+    def embed_one(text):
+        return embedder([text])[0]
+
+    # Version counters so collection reads can be cached but still
+    # refresh as soon as something is saved or deleted
+    if "style_version" not in st.session_state:
+        st.session_state.style_version = 0
+    if "creators_version" not in st.session_state:
+        st.session_state.creators_version = 0
+
+    # Client-side write buffers - one batched .add() pays the SQLite
+    # transaction and index-update cost once instead of per document
+    FLUSH_THRESHOLD = 100
+
+    if "pending_style" not in st.session_state:
+        st.session_state.pending_style = []
+    if "pending_creators" not in st.session_state:
+        st.session_state.pending_creators = []
+
+    def flush_pending(collection, buffer):
+        if not buffer:
+            return
+        collection.add(
+            documents=[doc for doc, _, _, _ in buffer],
+            metadatas=[meta for _, meta, _, _ in buffer],
+            ids=[doc_id for _, _, doc_id, _ in buffer],
+            embeddings=[emb for _, _, _, emb in buffer]
+        )
+        buffer.clear()
+
+    # Page size for the library views - fetching a page at a time keeps
+    # the per-render transfer bounded no matter how large a library grows
+    PAGE_SIZE = 50
+
+    # Memoized collection reads - reruns reuse the cached result, and
+    # bumping the version after a write invalidates it
+    @st.cache_data(ttl=60)
+    def load_my_style(version, limit=None, offset=None):
+        return my_style_collection.get(limit=limit, offset=offset)
+
+    @st.cache_data(ttl=60)
+    def load_creators(version, limit=None, offset=None):
+        return creators_collection.get(limit=limit, offset=offset)
+
+    # Grouping the creator library only needs metadata; skipping the
+    # document strings keeps the transfer tiny however large they get
+    @st.cache_data(ttl=60)
+    def load_creators_metadata(version):
+        return creators_collection.get(include=["metadatas"])
+
+    # Per-creator document fetch, deferred until previews are requested
+    @st.cache_data(ttl=60)
+    def load_creator_documents(creator, version):
+        return creators_collection.get(where={"creator_name": creator})
 
-    my_style_collection, creators_collection = init_vector_databases()
-    
     # Show model info
     st.info(f"Selected: {model_choice}")
-    
+
+    # One long-lived event loop on a background thread for all async
+    # client I/O. The cached clients' transports bind their connections
+    # to the first loop that uses them, so driving them from a fresh
+    # loop per interaction would fail once that loop is closed.
+    @st.cache_resource
+    def get_event_loop():
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+        return loop
+
+    # Clients are built once per process and reused across reruns:
+    # constructing one sets up TLS state and a connection pool, and
+    # keeping it warm amortizes the handshake across requests
+    @st.cache_resource
+    def get_openai_client():
+        if DefaultAioHttpClient is not None:
+            return AsyncOpenAI(api_key=openai_key, http_client=DefaultAioHttpClient())
+        return AsyncOpenAI(api_key=openai_key)
+
+    @st.cache_resource
+    def get_anthropic_client():
+        return AsyncAnthropic(api_key=claude_key)
+
+    # Two workers are enough: there are only two independent collections
+    # to search, and Chroma releases the GIL around its C++/SQLite work
+    @st.cache_resource
+    def get_query_executor():
+        return ThreadPoolExecutor(max_workers=2)
+
+    # Retrieval plus context assembly, memoized on its inputs. Users often
+    # re-click "Improve" with only the focus area changed, in which case
+    # the cache hit skips both vector queries entirely. The collection
+    # versions are part of the key so writes invalidate stale contexts.
+    @st.cache_data(ttl=600, max_entries=128)
+    def retrieve_context(script_prefix, use_style, use_creators, creator_key,
+                         style_version, creators_version):
+        executor = get_query_executor()
+        style_future = None
+        creator_future = None
+
+        if use_style:
+            style_future = executor.submit(
+                my_style_collection.query,
+                query_texts=[script_prefix],
+                n_results=2
+            )
+        if use_creators:
+            # Metadata where-filters force extra SQLite scans; for the
+            # handful of creators a user stores it is cheaper to
+            # over-fetch 3x unfiltered and post-filter in Python
+            creator_future = executor.submit(
+                creators_collection.query,
+                query_texts=[script_prefix],
+                n_results=9 if creator_key else 3
+            )
+
+        my_examples = style_future.result() if style_future else None
+        creator_examples = creator_future.result() if creator_future else None
+
+        if creator_examples is not None and creator_key:
+            selected_creators = set(creator_key)
+            kept = [
+                (doc, meta)
+                for doc, meta in zip(creator_examples['documents'][0], creator_examples['metadatas'][0])
+                if meta['creator_name'] in selected_creators
+            ][:3]
+            creator_examples = {
+                'documents': [[doc for doc, _ in kept]],
+                'metadatas': [[meta for _, meta in kept]]
+            }
+
+        context_parts = []
+
+        if use_style and my_examples['documents'][0]:
+            context_parts.append("Your personal writing style examples:")
+            context_parts.extend(
+                f"Your Style Example {i} - '{meta['title']}':\n{doc[:400]}..."
+                for i, (doc, meta) in enumerate(zip(my_examples['documents'][0], my_examples['metadatas'][0]), 1)
+            )
+
+        if use_creators and creator_examples['documents'][0]:
+            context_parts.append("\nSuccessful creator examples for inspiration:")
+            context_parts.extend(
+                f"Creator Example {i} - {meta['creator_name']}: '{meta['content_title']}':\n{doc[:400]}..."
+                for i, (doc, meta) in enumerate(zip(creator_examples['documents'][0], creator_examples['metadatas'][0]), 1)
+            )
+
+        return "\n\n".join(context_parts) if context_parts else "No relevant examples found."
+
+    # One shared rate-limited pool for every LLM request the app makes
+    @st.cache_resource
+    def get_llm_pool():
+        return LLMPool(max_concurrency=8, requests_per_minute=60, tokens_per_minute=90000)
+
     # Function to make AI call based on selected model
-    def make_ai_call(prompt):
+    async def make_ai_call(prompt, max_tokens=1000):
         if selected_model["provider"] == "openai":
-            client = OpenAI(api_key=openai_key)
-            response = client.chat.completions.create(
+            client = get_openai_client()
+            response = await client.chat.completions.create(
                 model=selected_model["model"],
                 messages=[{"role": "user", "content": prompt}]
             )
             return response.choices[0].message.content
         else:  # Claude
-            client = Anthropic(api_key=claude_key)
-            response = client.messages.create(
+            client = get_anthropic_client()
+            response = await client.messages.create(
                 model=selected_model["model"],
-                max_tokens=1000,
+                max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}]
             )
             return response.content[0].text
-    
-# Enhanced Script Editor Section
-st.subheader("Script Editor & Improvement")
-st.write("Transform your rough draft into a polished script using inspiration from your style and favorite creators.")
-
-# Script input
-user_script = st.text_area(
-    "Your rough draft:",
-    placeholder="Paste your script draft, outline, or rough ideas here...",
-    height=250
-)
-
-if user_script:
-    # Inspiration source selection
-    st.markdown("### Choose Your Inspiration Sources")
-    
-    inspiration_source = st.radio(
-        "What should inspire the improvement?",
-        ["My personal style only", "Favorite creators only", "Both my style and favorite creators"]
-    )
-    
-    # If choosing favorite creators, allow specific selection
-    creator_selection = None
-    if inspiration_source in ["Favorite creators only", "Both my style and favorite creators"]:
-        creator_stored = creators_collection.get()
-        if creator_stored['documents']:
-            # Get unique creator names
-            creator_names = list(set([meta['creator_name'] for meta in creator_stored['metadatas']]))
-            
-            creator_selection = st.multiselect(
-                "Select specific creators (leave empty for all):",
-                options=creator_names,
-                help="Choose specific creators to draw inspiration from, or leave empty to use all stored creator content"
-            )
-            
-            # Show selected creator content count
-            if creator_selection:
-                selected_count = sum(1 for meta in creator_stored['metadatas'] 
-                                   if meta['creator_name'] in creator_selection)
-                st.info(f"Using {selected_count} pieces of content from {len(creator_selection)} creators")
-        else:
-            st.warning("No creator content stored yet. Add some in the Favorite Creators tab.")
-    
-    # Improvement focus
-    improvement_focus = st.selectbox(
-        "Focus area for improvement:",
-        [
-            "Overall storytelling and flow", 
-            "Hook and opening strength", 
-            "Call-to-action effectiveness", 
-            "Clarity and structure",
-            "Emotional engagement",
-            "Match my personal voice"
-        ]
-    )
-    
-if st.button("Improve My Script"):
-    with st.spinner(f"Improving your script using {inspiration_source.lower()}..."):
+
+    # Streamed variant of make_ai_call: yields text chunks as they
+    # arrive so st.write_stream can render them live. Bridges the async
+    # client stream into the plain generator st.write_stream expects.
+    def stream_ai_call(prompt, max_tokens=1000):
+        async def chunks():
+            # Streaming counts against the same shared pool as the
+            # non-streaming path, so every LLM request is rate-limited
+            pool = get_llm_pool()
+            await pool.acquire(prompt)
+            try:
+                if selected_model["provider"] == "openai":
+                    client = get_openai_client()
+                    stream = await client.chat.completions.create(
+                        model=selected_model["model"],
+                        messages=[{"role": "user", "content": prompt}],
+                        stream=True
+                    )
+                    async for chunk in stream:
+                        yield chunk.choices[0].delta.content or ""
+                else:  # Claude
+                    client = get_anthropic_client()
+                    async with client.messages.stream(
+                        model=selected_model["model"],
+                        max_tokens=max_tokens,
+                        messages=[{"role": "user", "content": prompt}]
+                    ) as stream:
+                        async for text in stream.text_stream:
+                            yield text
+            finally:
+                pool.release()
+
+        loop = get_event_loop()
+        agen = chunks()
         try:
-            # Keep all your existing context building code here
-            context_parts = []
-            
-            if inspiration_source in ["My personal style only", "Both my style and favorite creators"]:
-                my_examples = my_style_collection.query(
-                    query_texts=[user_script[:500]],
-                    n_results=2
-                )
-                if my_examples['documents'][0]:
-                    context_parts.append("Your personal writing style examples:")
-                    for i, (doc, meta) in enumerate(zip(my_examples['documents'][0], my_examples['metadatas'][0]), 1):
-                        context_parts.append(f"Your Style Example {i} - '{meta['title']}':\n{doc[:400]}...")
-            
-            if inspiration_source in ["Favorite creators only", "Both my style and favorite creators"]:
-                where_filter = None
-                if creator_selection:
-                    where_filter = {"creator_name": {"$in": creator_selection}}
-                
-                creator_examples = creators_collection.query(
-                    query_texts=[user_script[:500]],
-                    n_results=3,
-                    where=where_filter
-                )
-                if creator_examples['documents'][0]:
-                    context_parts.append("\nSuccessful creator examples for inspiration:")
-                    for i, (doc, meta) in enumerate(zip(creator_examples['documents'][0], creator_examples['metadatas'][0]), 1):
-                        context_parts.append(f"Creator Example {i} - {meta['creator_name']}: '{meta['content_title']}':\n{doc[:400]}...")
-            
-            context = "\n\n".join(context_parts) if context_parts else "No relevant examples found."
-            
-            enhancement_prompt = f"""You are an expert script editor specializing in content creation and storytelling.
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+                except StopAsyncIteration:
+                    break
+        finally:
+            asyncio.run_coroutine_threadsafe(agen.aclose(), loop).result()
+
+    # Run one or more prompts concurrently, throttled by the shared
+    # pool. Single-response flows stream via stream_ai_call instead;
+    # this is the non-streaming path for batch features (e.g. N variants
+    # at once) that need all results before rendering.
+    def run_prompts(prompts, max_tokens=1000):
+        pool = get_llm_pool()
+
+        async def call_one(p):
+            return await make_ai_call(p, max_tokens=max_tokens)
+
+        async def gather_all():
+            return await asyncio.gather(*[pool.submit(call_one, p) for p in prompts])
+        return asyncio.run_coroutine_threadsafe(gather_all(), get_event_loop()).result()
+    
+# Built once at import instead of re-assembled f-string-by-f-string on
+# every click
+PROMPT_TEMPLATE = """You are an expert script editor specializing in content creation and storytelling.
 
                 ORIGINAL SCRIPT TO IMPROVE:
-                "{user_script}"
+                "{script}"
 
-                FOCUS AREA: {improvement_focus}
+                FOCUS AREA: {focus}
 
                 INSPIRATION SOURCES:
                 {context}
 
                 Your task:
-                1. Rewrite and improve the original script, focusing specifically on {improvement_focus.lower()}
+                1. Rewrite and improve the original script, focusing specifically on {focus_lower}
                 2. Draw inspiration from the provided examples while maintaining the user's authentic voice
                 3. Enhance storytelling elements, structure, and engagement
                 4. Keep the core message but elevate the execution
@@ -200,28 +379,131 @@ if st.button("Improve My Script"):
                 Provide the improved script.
 
                 Make it compelling, authentic, and ready to use."""
+
+# Interactions inside a fragment rerun only that fragment, so edits in
+# the memory tabs no longer re-run the script editor and vice versa
+@st.fragment
+def script_editor():
+    # Enhanced Script Editor Section
+    st.subheader("Script Editor & Improvement")
+    st.write("Transform your rough draft into a polished script using inspiration from your style and favorite creators.")
+
+    # Script input
+    user_script = st.text_area(
+        "Your rough draft:",
+        placeholder="Paste your script draft, outline, or rough ideas here...",
+        height=250
+    )
+
+    if user_script:
+        # Inspiration source selection
+        st.markdown("### Choose Your Inspiration Sources")
+    
+        inspiration_source = st.radio(
+            "What should inspire the improvement?",
+            ["My personal style only", "Favorite creators only", "Both my style and favorite creators"]
+        )
+    
+        # If choosing favorite creators, allow specific selection
+        creator_selection = None
+        if inspiration_source in ["Favorite creators only", "Both my style and favorite creators"]:
+            creator_stored = load_creators(st.session_state.creators_version)
+            if creator_stored['documents']:
+                # Get unique creator names
+                creator_names = list(set([meta['creator_name'] for meta in creator_stored['metadatas']]))
             
-            improved_script = make_ai_call(enhancement_prompt)
-            
-            # Store in session state
-            st.session_state.enhanced_script = improved_script
+                creator_selection = st.multiselect(
+                    "Select specific creators (leave empty for all):",
+                    options=creator_names,
+                    help="Choose specific creators to draw inspiration from, or leave empty to use all stored creator content"
+                )
             
+                # Show selected creator content count
+                if creator_selection:
+                    selected_count = sum(1 for meta in creator_stored['metadatas'] 
+                                       if meta['creator_name'] in creator_selection)
+                    st.info(f"Using {selected_count} pieces of content from {len(creator_selection)} creators")
+            else:
+                st.warning("No creator content stored yet. Add some in the Favorite Creators tab.")
+    
+        # Improvement focus
+        improvement_focus = st.selectbox(
+            "Focus area for improvement:",
+            [
+                "Overall storytelling and flow", 
+                "Hook and opening strength", 
+                "Call-to-action effectiveness", 
+                "Clarity and structure",
+                "Emotional engagement",
+                "Match my personal voice"
+            ]
+        )
+    
+    if st.button("Improve My Script"):
+        try:
+            use_style = inspiration_source in ["My personal style only", "Both my style and favorite creators"]
+            use_creators = inspiration_source in ["Favorite creators only", "Both my style and favorite creators"]
+
+            # Reuse the composed prompt when nothing feeding into it changed
+            # (e.g. the user clicks 'Improve' twice in a row)
+            prompt_key = (
+                hash(user_script), improvement_focus, inspiration_source,
+                tuple(sorted(creator_selection or ())),
+                st.session_state.style_version, st.session_state.creators_version
+            )
+            if st.session_state.get("prompt_key") == prompt_key:
+                enhancement_prompt = st.session_state.cached_prompt
+            else:
+                context = retrieve_context(
+                    user_script[:500],
+                    use_style,
+                    use_creators,
+                    tuple(sorted(creator_selection or ())),
+                    st.session_state.style_version,
+                    st.session_state.creators_version
+                )
+                enhancement_prompt = PROMPT_TEMPLATE.format(
+                    script=user_script,
+                    focus=improvement_focus,
+                    focus_lower=improvement_focus.lower(),
+                    context=context
+                )
+                st.session_state.prompt_key = prompt_key
+                st.session_state.cached_prompt = enhancement_prompt
+
+            # Budget the response to the draft's size instead of a blanket
+            # cap - an improved script runs a bit longer than the original
+            response_budget = min(4096, max(1000, 4 * len(user_script.split())))
+
+            # Stream tokens to the page as they arrive; write_stream returns
+            # the joined text once the stream is done
+            st.markdown("### Your Enhanced Script")
+            st.session_state.enhanced_script = st.write_stream(
+                stream_ai_call(enhancement_prompt, max_tokens=response_budget)
+            )
+            st.session_state.script_just_streamed = True
+
             st.success("Script improved successfully!")
-            
+
         except Exception as e:
             st.error(f"Error improving script: {str(e)}")
 
-# Display the enhanced script if it exists
-if 'enhanced_script' in st.session_state:
-    st.markdown("### Your Enhanced Script")
-    st.write(st.session_state.enhanced_script)
+    # Display the enhanced script if it exists (skip the copy that was just
+    # streamed live by the handler above)
+    if 'enhanced_script' in st.session_state:
+        if not st.session_state.pop('script_just_streamed', False):
+            st.markdown("### Your Enhanced Script")
+            st.write(st.session_state.enhanced_script)
     
-    st.download_button(
-        label="Download Enhanced Script",
-        data=st.session_state.enhanced_script,
-        file_name="enhanced_script.txt",
-        mime="text/plain"
-    )
+        st.download_button(
+            label="Download Enhanced Script",
+            data=st.session_state.enhanced_script,
+            file_name="enhanced_script.txt",
+            mime="text/plain"
+        )
+
+
+script_editor()
 
 # Content Memory Banks
 st.markdown("---")
@@ -231,7 +513,8 @@ st.subheader("Content Memory Banks")
 memory_tab1, memory_tab2 = st.tabs(["My Style Library", "Favorite Creators"])
 
 # Tab 1: My Style
-with memory_tab1:
+@st.fragment
+def style_library():
     style_subtab1, style_subtab2 = st.tabs(["Add Style Example", "View My Content"])
     
     with style_subtab1:
@@ -250,43 +533,81 @@ with memory_tab1:
         
         if st.button("Save My Style Example"):
             if example_title and example_script:
-                my_style_collection.add(
-                    documents=[example_script],
-                    metadatas=[{
+                st.session_state.pending_style.append((
+                    example_script,
+                    {
                         "title": example_title,
                         "notes": example_notes,
                         "timestamp": str(datetime.now())
-                    }],
-                    ids=[f"my_style_{len(my_style_collection.get()['ids']) + 1}"]
-                )
-                st.success(f"Saved: {example_title}")
+                    },
+                    f"my_style_{uuid.uuid4().hex}",
+                    embed_one(example_script)
+                ))
+                if len(st.session_state.pending_style) >= FLUSH_THRESHOLD:
+                    flush_pending(my_style_collection, st.session_state.pending_style)
+                    st.session_state.style_version += 1
+                st.success(f"Queued: {example_title}")
+
+        if st.session_state.pending_style:
+            if st.button(f"Flush ({len(st.session_state.pending_style)} pending)", key="flush_style"):
+                flush_pending(my_style_collection, st.session_state.pending_style)
+                st.session_state.style_version += 1
+                st.rerun()
     
     with style_subtab2:
-        my_stored_examples = my_style_collection.get()
-        if my_stored_examples['documents']:
-            st.write(f"You have {len(my_stored_examples['documents'])} style examples:")
-            
-            for i, (doc, metadata, doc_id) in enumerate(zip(
-                my_stored_examples['documents'], 
-                my_stored_examples['metadatas'], 
+        style_total = my_style_collection.count()
+        if style_total:
+            st.write(f"You have {style_total} style examples:")
+
+            page = 0
+            if style_total > PAGE_SIZE:
+                max_page = (style_total - 1) // PAGE_SIZE
+                # Clamp a stale page index before the widget validates it:
+                # deleting rows while on the last page can leave the stored
+                # value above the recomputed max, which st.number_input
+                # rejects on the next rerun
+                if st.session_state.get("style_page", 0) > max_page:
+                    st.session_state.style_page = max_page
+                page = st.number_input(
+                    "Page", min_value=0,
+                    max_value=max_page,
+                    step=1, key="style_page"
+                )
+            my_stored_examples = load_my_style(
+                st.session_state.style_version, PAGE_SIZE, page * PAGE_SIZE
+            )
+
+            selected_ids = []
+            for doc, metadata, doc_id in zip(
+                my_stored_examples['documents'],
+                my_stored_examples['metadatas'],
                 my_stored_examples['ids']
-            )):
+            ):
                 col1, col2 = st.columns([4, 1])
-                
+
                 with col1:
                     with st.expander(f"My Content: {metadata['title']}"):
                         st.write(f"**Notes:** {metadata.get('notes', 'None')}")
                         st.write(f"**Content:** {doc[:300]}...")
-                
+
                 with col2:
-                    if st.button("Delete", key=f"delete_my_{doc_id}"):
-                        my_style_collection.delete(ids=[doc_id])
-                        st.rerun()
+                    if st.checkbox("Select", key=f"sel_my_{doc_id}"):
+                        selected_ids.append(doc_id)
+
+            # One batched delete instead of one transaction per row
+            if st.button("Delete Selected", key="delete_my_selected"):
+                if selected_ids:
+                    my_style_collection.delete(ids=selected_ids)
+                    st.session_state.style_version += 1
+                    st.rerun()
+                else:
+                    st.warning("No items selected.")
         else:
             st.info("No style examples stored yet.")
 
 # Tab 2: Favorite Creators
-with memory_tab2:
+@st.fragment
+def creators_library():
     creator_subtab1, creator_subtab2 = st.tabs(["Add Creator Content", "Browse Creator Library"])
     
     with creator_subtab1:
@@ -306,48 +627,80 @@ with memory_tab2:
         
         if st.button("Save Creator Content"):
             if creator_name and content_title and creator_content:
-                creators_collection.add(
-                    documents=[creator_content],
-                    metadatas=[{
+                st.session_state.pending_creators.append((
+                    creator_content,
+                    {
                         "creator_name": creator_name,
                         "content_title": content_title,
                         "notes": content_notes,
                         "timestamp": str(datetime.now())
-                    }],
-                    ids=[f"creator_{len(creators_collection.get()['ids']) + 1}"]
-                )
-                st.success(f"Saved content from {creator_name}: {content_title}")
+                    },
+                    f"creator_{uuid.uuid4().hex}",
+                    embed_one(creator_content)
+                ))
+                if len(st.session_state.pending_creators) >= FLUSH_THRESHOLD:
+                    flush_pending(creators_collection, st.session_state.pending_creators)
+                    st.session_state.creators_version += 1
+                st.success(f"Queued content from {creator_name}: {content_title}")
+
+        if st.session_state.pending_creators:
+            if st.button(f"Flush ({len(st.session_state.pending_creators)} pending)", key="flush_creators"):
+                flush_pending(creators_collection, st.session_state.pending_creators)
+                st.session_state.creators_version += 1
+                st.rerun()
     
     with creator_subtab2:
-        creator_stored = creators_collection.get()
-        if creator_stored['documents']:
-            # Group by creator
+        creators_total = creators_collection.count()
+        if creators_total:
+            # Group by creator from metadata alone - the documents stay
+            # in SQLite until a group's previews are requested
+            creator_meta = load_creators_metadata(st.session_state.creators_version)
             creators_dict = {}
-            for doc, metadata, doc_id in zip(
-                creator_stored['documents'], 
-                creator_stored['metadatas'], 
-                creator_stored['ids']
-            ):
+            for metadata, doc_id in zip(creator_meta['metadatas'], creator_meta['ids']):
                 creator = metadata['creator_name']
                 if creator not in creators_dict:
                     creators_dict[creator] = []
-                creators_dict[creator].append((doc, metadata, doc_id))
-            
+                creators_dict[creator].append((metadata, doc_id))
+
             st.write(f"Content from {len(creators_dict)} creators:")
-            
+
+            selected_ids = []
             for creator_name, content_list in creators_dict.items():
                 with st.expander(f"Content from {creator_name} ({len(content_list)} videos)"):
-                    for doc, metadata, doc_id in content_list:
+                    docs_by_id = {}
+                    if st.toggle("Show content previews", key=f"show_{creator_name}"):
+                        group = load_creator_documents(
+                            creator_name, st.session_state.creators_version
+                        )
+                        docs_by_id = dict(zip(group['ids'], group['documents']))
+
+                    for metadata, doc_id in content_list:
                         col1, col2 = st.columns([4, 1])
-                        
+
                         with col1:
                             st.write(f"**{metadata['content_title']}**")
                             st.write(f"Notes: {metadata.get('notes', 'None')}")
-                            st.write(f"Content: {doc[:200]}...")
-                        
+                            if doc_id in docs_by_id:
+                                st.write(f"Content: {docs_by_id[doc_id][:200]}...")
+
                         with col2:
-                            if st.button("Delete", key=f"delete_creator_{doc_id}"):
-                                creators_collection.delete(ids=[doc_id])
-                                st.rerun()
+                            if st.checkbox("Select", key=f"sel_creator_{doc_id}"):
+                                selected_ids.append(doc_id)
+
+            # One batched delete instead of one transaction per row
+            if st.button("Delete Selected", key="delete_creator_selected"):
+                if selected_ids:
+                    creators_collection.delete(ids=selected_ids)
+                    st.session_state.creators_version += 1
+                    st.rerun()
+                else:
+                    st.warning("No items selected.")
         else:
-            st.info("No creator content stored yet.")
\ No newline at end of file
+            st.info("No creator content stored yet.")
+
+
+with memory_tab1:
+    style_library()
+
+with memory_tab2:
+    creators_library()
\ No newline at end of file
@@ -0,0 +1,71 @@
+# Rate-limited async pool for LLM API calls, based on the OpenAI cookbook
+# api_request_parallel_processor pattern: a concurrency cap plus
+# requests-per-minute and tokens-per-minute buckets, so bursts of prompts
+# run in parallel without tripping API rate limits (429s).
+
+import asyncio
+import time
+
+
+def estimate_tokens(prompt):
+    # Rough chars/4 heuristic - only used for throttling, not billing
+    return max(1, len(prompt) // 4)
+
+
+class LLMPool:
+    def __init__(self, max_concurrency=8, requests_per_minute=60, tokens_per_minute=90000):
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._in_flight = 0
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+
+    def _refill(self):
+        # Replenish the buckets based on elapsed time. Done on demand
+        # instead of in a background task so the pool keeps working across
+        # the short-lived event loops Streamlit interactions create.
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._available_requests = min(
+            float(self.requests_per_minute),
+            self._available_requests + elapsed * self.requests_per_minute / 60.0
+        )
+        self._available_tokens = min(
+            float(self.tokens_per_minute),
+            self._available_tokens + elapsed * self.tokens_per_minute / 60.0
+        )
+
+    async def acquire(self, prompt):
+        # Wait until there is concurrency headroom and bucket capacity,
+        # then reserve a slot. The event loop is single-threaded, so the
+        # check-and-reserve below needs no extra locking. Every acquire
+        # must be paired with a release().
+        #
+        # Clamp to the bucket capacity: a prompt estimated above the
+        # per-minute budget could otherwise never satisfy the check and
+        # would spin here forever - let the API reject it instead.
+        needed_tokens = min(estimate_tokens(prompt), self.tokens_per_minute)
+        while True:
+            self._refill()
+            if (self._in_flight < self.max_concurrency
+                    and self._available_requests >= 1
+                    and self._available_tokens >= needed_tokens):
+                break
+            await asyncio.sleep(0.05)
+
+        self._available_requests -= 1
+        self._available_tokens -= needed_tokens
+        self._in_flight += 1
+
+    def release(self):
+        self._in_flight -= 1
+
+    async def submit(self, call, prompt):
+        await self.acquire(prompt)
+        try:
+            return await call(prompt)
+        finally:
+            self.release()